@@ -10,7 +10,7 @@ from src.utils import load_settings, load_manifest, save_manifest
 from src.management import sync_files, delete_file_metadata
 from src.ragpipeline import process_file
 from src.embedding import get_embeddings
-from src.retrieval import load_all_vectorstores, combine_retrieval, call_groq_llm
+from src.retrieval import route_collections, load_all_vectorstores, combine_retrieval, call_groq_llm
 
 # -----------------------------
 # USER QUERY (edit this)
@@ -67,8 +67,12 @@ def main():
     print("Preparing embeddings...")
     embed_model = get_embeddings(settings["embedding_model_name"])
 
+    print("Routing query...")
+    routed = route_collections(manifest, settings, embed_model, query)
+    print(f"  Searching {len(routed)} of {len(manifest)} documents")
+
     print("Loading vectorstores...")
-    stores = load_all_vectorstores(manifest, settings, embed_model)
+    stores = load_all_vectorstores(routed, settings, embed_model)
 
     if not stores:
         print("No documents to search. Exiting.")
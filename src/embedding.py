@@ -7,11 +7,15 @@ This version sanitizes Chroma collection names so they meet Chroma's requirement
  - allowed chars: a-zA-Z0-9._-
  - length roughly 3-512 chars
  - must start and end with an alphanumeric character
+
+It also summarizes each collection as a few unit-length centroids of its chunk
+embeddings, which retrieval uses to route queries to the most promising collections.
 """
 
 import os
 import re
 import uuid
+import numpy as np
 # from langchain_community.embeddings import HuggingFaceEmbeddings
 # from langchain_community.vectorstores import Chroma
 from langchain_huggingface import HuggingFaceEmbeddings
@@ -87,3 +91,51 @@ def index_chunks_into_chroma(chunks, chroma_path, collection_name, embed_model):
         raise RuntimeError(f"Failed to create or write to Chroma collection '{safe_name}': {e}") from e
 
     return vectordb
+
+
+def compute_summary_vectors(embeddings, n_centroids=1, n_iter=10):
+    """
+    Summarize a document's chunk embeddings as up to n_centroids unit vectors.
+    Uses the normalized mean for a single centroid, else a small k-means (cosine).
+    Returns a list of lists of floats (JSON-serializable for the manifest).
+    """
+    vecs = np.asarray(embeddings, dtype=np.float32)
+    if vecs.ndim != 2 or len(vecs) == 0:
+        return []
+
+    norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+    vecs = vecs / np.maximum(norms, 1e-12)
+
+    n_centroids = max(1, min(int(n_centroids), len(vecs)))
+    if n_centroids == 1:
+        centroids = vecs.mean(axis=0, keepdims=True)
+    else:
+        # deterministic init: evenly spaced chunks through the document
+        init_idx = np.linspace(0, len(vecs) - 1, n_centroids).astype(int)
+        centroids = vecs[init_idx].copy()
+        for _ in range(n_iter):
+            assign = np.argmax(vecs @ centroids.T, axis=1)
+            for c in range(n_centroids):
+                members = vecs[assign == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+
+    norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+    centroids = centroids / np.maximum(norms, 1e-12)
+    return [[round(float(x), 6) for x in c] for c in centroids]
+
+
+def summarize_collection(vectordb, n_centroids=1):
+    """
+    Read back the stored chunk embeddings of a collection and summarize them.
+    Returns [] if embeddings cannot be read (routing then always searches this collection).
+    """
+    try:
+        data = vectordb.get(include=["embeddings"])
+        embeddings = data.get("embeddings")
+        if embeddings is None or len(embeddings) == 0:
+            return []
+        return compute_summary_vectors(embeddings, n_centroids)
+    except Exception as e:
+        print(f"  Warning: could not summarize collection: {e}")
+        return []
@@ -4,7 +4,7 @@ High-level orchestration:
 - ingestion (PDF/TXT)
 - chunking
 - embedding + vectorstore
-- updating manifest
+- updating manifest (including per-document summary vectors for query routing)
 
 This version imports the sanitizer from embedding.py and writes the sanitized
 collection name into the manifest so manifest stays consistent.
@@ -14,7 +14,7 @@ import os
 from src.ingestion import extract_text_from_pdf, extract_text_from_txt, init_ocr_model
 from src.chunking import chunk_documents
 from src.embedding import get_embeddings, _sanitize_collection_name
-from src.embedding import index_chunks_into_chroma
+from src.embedding import index_chunks_into_chroma, summarize_collection
 from src.utils import timestamp
 
 
@@ -44,13 +44,16 @@ def process_file(filename, sha, settings, manifest):
     raw_collection_name = f"col_{os.path.splitext(filename)[0]}"
     collection_name = _sanitize_collection_name(raw_collection_name)
 
-    index_chunks_into_chroma(
+    vectordb = index_chunks_into_chroma(
         chunks=chunks,
         chroma_path=settings["vector_db_path"],
         collection_name=collection_name,
         embed_model=embed_model,
     )
 
+    # Compact summary of the document used to route queries at retrieval time
+    summary_vectors = summarize_collection(vectordb, settings.get("summary_centroids", 1))
+
     # Update manifest with sanitized collection name
     entry = {
         "filename": filename,
@@ -60,6 +63,7 @@ def process_file(filename, sha, settings, manifest):
         "sha1": sha,
         "page_count": len(docs),
         "ocr_low_confidence_pages": low_conf,
+        "summary_vectors": summary_vectors,
         "upload_timestamp": manifest.get(filename, {}).get("upload_timestamp", timestamp()),
         "last_processed": timestamp(),
     }
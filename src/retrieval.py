@@ -3,6 +3,7 @@ retrieval.py
 Creates retriever from multiple Chroma collections and calls Groq LLM.
 
 This version:
+- routes each query to the top-M collections by their manifest summary vectors
 - sanitizes collection names when loading (keeps compatibility)
 - performs retrieval per-collection
 - guarantees at least one hit per collection (if available) to increase source diversity
@@ -10,6 +11,7 @@ This version:
 """
 
 import os
+import numpy as np
 import requests
 # from langchain_community.vectorstores import Chroma
 from langchain_chroma import Chroma
@@ -17,6 +19,47 @@ from langchain_core.documents import Document
 from src.embedding import _sanitize_collection_name
 
 
+def route_collections(manifest, settings, embed_model, query):
+    """
+    Pick the manifest entries worth searching for this query.
+    Each entry is scored by the best cosine similarity between the query embedding
+    and its "summary_vectors"; only the top `routing_top_m` entries are kept.
+    Falls back to the full manifest when routing is disabled (top_m <= 0),
+    when top_m covers every entry, or when the query cannot be embedded.
+    Entries without summary vectors (older manifests) are always kept.
+    Returns a dict with the same shape as the manifest.
+    """
+    top_m = settings.get("routing_top_m", 0) or 0
+    if top_m <= 0 or len(manifest) <= top_m:
+        return manifest
+
+    try:
+        q = np.asarray(embed_model.embed_query(query), dtype=np.float32)
+        q = q / max(float(np.linalg.norm(q)), 1e-12)
+    except Exception as e:
+        print(f"Warning: could not embed query for routing, searching all collections: {e}")
+        return manifest
+
+    scored = []
+    unsummarized = []
+    for f, entry in manifest.items():
+        summaries = entry.get("summary_vectors")
+        if not summaries:
+            unsummarized.append(f)
+            continue
+        centroids = np.asarray(summaries, dtype=np.float32)
+        if centroids.ndim != 2 or centroids.shape[1] != q.shape[0]:
+            # embedding model changed since ingestion; cannot compare
+            unsummarized.append(f)
+            continue
+        scored.append((float(np.max(centroids @ q)), f))
+
+    scored.sort(key=lambda x: x[0], reverse=True)
+    selected = [f for _, f in scored[:top_m]] + unsummarized
+
+    return {f: manifest[f] for f in selected}
+
+
 def load_all_vectorstores(manifest, settings, embed_model):
     """
     Load each file's collection and combine into a list of vectorstores.